@@ -17,7 +17,8 @@ Example usage:
             self.shooter.shoot()
 """
 
-from typing import Callable, TypeAlias
+from enum import IntEnum
+from typing import Callable, Iterable, TypeAlias
 
 import magicbot as mb
 import wpilib
@@ -31,6 +32,15 @@ import components
 ListNamedCallbacks: TypeAlias = list[tuple[str, Callable[[], None] | None]]
 
 
+class _Phase(IntEnum):
+    """Execution phases for ChoreoMultiTrajectoryAuto's single periodic state."""
+
+    START = 0
+    FOLLOW = 1
+    ACTION = 2
+    DONE = 3
+
+
 class ChoreoAuto(mb.AutonomousStateMachine):
     """Base class for Choreo trajectory-based autonomous routines.
 
@@ -55,6 +65,19 @@ class ChoreoAuto(mb.AutonomousStateMachine):
         DEFAULT: Set to True to make this the default auto mode.
     """
 
+    # Slot the hot per-tick attributes; the magicbot base class still provides
+    # a __dict__, so injected components and subclass extras are unaffected
+    __slots__ = (
+        "_trajectory",
+        "_timer",
+        "_trajectory_finished",
+        "_total_time",
+        "_is_red",
+        "_sample_at",
+        "_follow",
+        "_stop",
+    )
+
     # Subclasses must override these
     MODE_NAME = "Choreo Auto Base"
     TRAJECTORY_NAME: str = ""
@@ -63,8 +86,10 @@ class ChoreoAuto(mb.AutonomousStateMachine):
     # Components injected by MagicBot
     drivetrain: components.Drivetrain
 
-    # Class-level trajectory cache to avoid reloading
-    _trajectory_cache: dict[str, SwerveTrajectory | None] = {}
+    # Class-level trajectory caches to avoid reloading; successful loads and
+    # failed names are tracked separately so the common case is one dict probe
+    _loaded: dict[str, SwerveTrajectory] = {}
+    _failed: set[str] = set()
 
     def __init__(self) -> None:
         """Initialize the autonomous state machine."""
@@ -72,6 +97,14 @@ class ChoreoAuto(mb.AutonomousStateMachine):
         self._trajectory: SwerveTrajectory | None = None
         self._timer = wpilib.Timer()
         self._trajectory_finished = False
+        # Cached per enable so the 50 Hz follow state doesn't re-query them
+        self._total_time = 0.0
+        self._is_red = False
+        # Bound methods cached per enable to avoid re-resolving the attribute
+        # chains (self.drivetrain.follow_trajectory etc.) every tick
+        self._sample_at: Callable[[float, bool], SwerveSample | None] | None = None
+        self._follow: Callable[[SwerveSample], None] | None = None
+        self._stop: Callable[[], None] | None = None
 
     @classmethod
     def load_trajectory(cls, name: str) -> SwerveTrajectory | None:
@@ -86,22 +119,45 @@ class ChoreoAuto(mb.AutonomousStateMachine):
         Returns:
             The loaded trajectory, or None if it couldn't be loaded.
         """
-        if name not in cls._trajectory_cache:
-            try:
-                # load_swerve_trajectory returns Optional[SwerveTrajectory]
-                # It loads from deploy/choreo/{name}.traj
-                trajectory = load_swerve_trajectory(name)
-                cls._trajectory_cache[name] = trajectory
-                if trajectory is None:
-                    wpilib.reportWarning(
-                        f"Choreo: Could not load trajectory '{name}'. Make sure deploy/choreo/{name}.traj exists.",
-                        False,
-                    )
-            except Exception as e:
-                wpilib.reportError(f"Choreo: Error loading trajectory '{name}': {e}", True)
-                cls._trajectory_cache[name] = None
-
-        return cls._trajectory_cache[name]
+        trajectory = cls._loaded.get(name)
+        if trajectory is not None:
+            return trajectory
+        if name in cls._failed:
+            return None
+
+        try:
+            # load_swerve_trajectory returns Optional[SwerveTrajectory]
+            # It loads from deploy/choreo/{name}.traj
+            trajectory = load_swerve_trajectory(name)
+        except Exception as e:
+            wpilib.reportError(f"Choreo: Error loading trajectory '{name}': {e}", True)
+            cls._failed.add(name)
+            return None
+
+        if trajectory is None:
+            wpilib.reportWarning(
+                f"Choreo: Could not load trajectory '{name}'. Make sure deploy/choreo/{name}.traj exists.",
+                False,
+            )
+            cls._failed.add(name)
+            return None
+
+        cls._loaded[name] = trajectory
+        return trajectory
+
+    @classmethod
+    def preload(cls, names: Iterable[str]) -> None:
+        """Load a set of trajectories into the cache ahead of time.
+
+        Call this during robot startup so that the JSON parse from flash
+        happens before the autonomous clock is running; on_enable() then
+        gets a cache hit instead of paying for the load.
+
+        Args:
+            names: The trajectory names (without .traj extension) to load.
+        """
+        for name in names:
+            cls.load_trajectory(name)
 
     @staticmethod
     def is_red_alliance() -> bool:
@@ -131,9 +187,18 @@ class ChoreoAuto(mb.AutonomousStateMachine):
         # Reset state
         self._trajectory_finished = False
 
+        # Cache values that are constant for the rest of the match so the
+        # follow state doesn't re-query them every loop iteration
+        self._is_red = self.is_red_alliance()
+        self._follow = self.drivetrain.follow_trajectory
+        self._stop = self.drivetrain.stop
+        if self._trajectory is not None:
+            self._total_time = self._trajectory.get_total_time()
+            self._sample_at = self._trajectory.sample_at
+
         # Set the robot's starting pose to match the trajectory
         if self._trajectory is not None:
-            initial_pose = self._trajectory.get_initial_pose(self.is_red_alliance())
+            initial_pose = self._trajectory.get_initial_pose(self._is_red)
             if initial_pose is not None:
                 self.drivetrain.reset_pose(initial_pose)
                 wpilib.reportError(
@@ -209,7 +274,7 @@ class ChoreoAuto(mb.AutonomousStateMachine):
         elapsed_time = self._timer.get()
 
         # Check if we've finished the trajectory
-        total_time = self._trajectory.get_total_time()
+        total_time = self._total_time
         if elapsed_time >= total_time:
             self.next_state("trajectory_complete")
             return
@@ -218,14 +283,14 @@ class ChoreoAuto(mb.AutonomousStateMachine):
         self.during_trajectory(elapsed_time, total_time)
 
         # Sample the trajectory at the current time
-        sample = self._trajectory.sample_at(elapsed_time, self.is_red_alliance())
+        sample = self._sample_at(elapsed_time, self._is_red)
 
         if sample is not None:
             # Follow the trajectory sample
-            self.drivetrain.follow_trajectory(sample)
+            self._follow(sample)
         else:
             # Couldn't get a sample, just stop
-            self.drivetrain.stop()
+            self._stop()
 
     @mb.state()
     def trajectory_complete(self) -> None:
@@ -237,8 +302,8 @@ class ChoreoAuto(mb.AutonomousStateMachine):
             # Call user-defined end hook
             self.on_trajectory_end()
 
-        # Stay stopped
-        self.drivetrain.stop()
+        # No need to re-issue the stop: the drivetrain idles whenever a loop
+        # iteration makes no request, so the robot stays stopped on its own
 
 
 class ChoreoMultiTrajectoryAuto(mb.AutonomousStateMachine):
@@ -269,6 +334,24 @@ class ChoreoMultiTrajectoryAuto(mb.AutonomousStateMachine):
                 self.shooter.shoot()
     """
 
+    # Slot the hot per-tick attributes, as in ChoreoAuto
+    __slots__ = (
+        "_names",
+        "_actions",
+        "_trajectory_objs",
+        "_current_trajectory_index",
+        "_current_trajectory",
+        "_current_name",
+        "_current_action",
+        "_timer",
+        "_total_time",
+        "_is_red",
+        "_sample_at",
+        "_follow",
+        "_stop",
+        "_phase",
+    )
+
     MODE_NAME = "Multi-Trajectory Auto Base"
     DISABLED = True  # Base class should not be registered as an autonomous mode
 
@@ -277,10 +360,24 @@ class ChoreoMultiTrajectoryAuto(mb.AutonomousStateMachine):
     def __init__(self) -> None:
         """Initialize the autonomous state machine."""
         super().__init__()
-        self._trajectories: ListNamedCallbacks = []
+        # The sequence from setup_trajectories(), split into parallel lists so
+        # the hot states index plain lists instead of unpacking tuples
+        self._names: list[str] = []
+        self._actions: list[Callable[[], None] | None] = []
+        self._trajectory_objs: list[SwerveTrajectory | None] = []
         self._current_trajectory_index = 0
         self._current_trajectory: SwerveTrajectory | None = None
+        self._current_name = ""
+        self._current_action: Callable[[], None] | None = None
         self._timer = wpilib.Timer()
+        # Cached per enable / per trajectory so the follow state doesn't re-query them
+        self._total_time = 0.0
+        self._is_red = False
+        # Bound methods cached per enable / per trajectory, as in ChoreoAuto
+        self._sample_at: Callable[[float, bool], SwerveSample | None] | None = None
+        self._follow: Callable[[SwerveSample], None] | None = None
+        self._stop: Callable[[], None] | None = None
+        self._phase = _Phase.START
 
     def setup_trajectories(self) -> ListNamedCallbacks:
         """Define the sequence of trajectories and actions.
@@ -322,80 +419,86 @@ class ChoreoMultiTrajectoryAuto(mb.AutonomousStateMachine):
         """Called when autonomous mode starts."""
         super().on_enable()
 
-        self._trajectories = self.setup_trajectories()
+        pairs = self.setup_trajectories()
+        self._names = [name for name, _ in pairs]
+        self._actions = [action for _, action in pairs]
+        self._trajectory_objs = [ChoreoAuto.load_trajectory(name) for name in self._names]
         self._current_trajectory_index = 0
+        self._is_red = ChoreoAuto.is_red_alliance()
+        self._follow = self.drivetrain.follow_trajectory
+        self._stop = self.drivetrain.stop
+        self._phase = _Phase.START
         self._load_current_trajectory()
 
         # Set initial pose from first trajectory
         if self._current_trajectory is not None:
-            initial_pose = self._current_trajectory.get_initial_pose(ChoreoAuto.is_red_alliance())
+            initial_pose = self._current_trajectory.get_initial_pose(self._is_red)
             if initial_pose is not None:
                 self.drivetrain.reset_pose(initial_pose)
 
     def _load_current_trajectory(self) -> None:
         """Load the current trajectory from the sequence."""
-        if self._current_trajectory_index < len(self._trajectories):
-            name, _ = self._trajectories[self._current_trajectory_index]
-            self._current_trajectory = ChoreoAuto.load_trajectory(name)
+        index = self._current_trajectory_index
+        if index < len(self._names):
+            self._current_trajectory = self._trajectory_objs[index]
+            self._current_name = self._names[index]
+            self._current_action = self._actions[index]
         else:
             self._current_trajectory = None
+            self._current_name = ""
+            self._current_action = None
+
+        if self._current_trajectory is not None:
+            self._total_time = self._current_trajectory.get_total_time()
+            self._sample_at = self._current_trajectory.sample_at
 
     @mb.state(first=True)
-    def start_trajectory(self) -> None:
-        """Start following the current trajectory."""
-        if self._current_trajectory is None:
-            self.next_state("all_complete")
-            return
+    def run(self) -> None:
+        """Advance the trajectory sequence.
 
-        self._timer.restart()
-        self.next_state("follow_trajectory")
+        A single periodic state with an internal phase avoids MagicBot's
+        per-tick state re-dispatch; the hot FOLLOW branch is checked first.
+        """
+        match self._phase:
+            case _Phase.FOLLOW:
+                elapsed_time = self._timer.get()
+                total_time = self._total_time
 
-    @mb.state()
-    def follow_trajectory(self) -> None:
-        """Follow the current trajectory."""
-        if self._current_trajectory is None:
-            self.next_state("run_action")
-            return
+                if elapsed_time >= total_time:
+                    self._phase = _Phase.ACTION
+                    return
 
-        elapsed_time = self._timer.get()
-        total_time = self._current_trajectory.get_total_time()
+                # Call the during_trajectory hook for user actions while moving
+                self.during_trajectory(self._current_trajectory_index, self._current_name, elapsed_time, total_time)
 
-        if elapsed_time >= total_time:
-            self.next_state("run_action")
-            return
+                sample = self._sample_at(elapsed_time, self._is_red)
+                if sample is not None:
+                    self._follow(sample)
+                else:
+                    self._stop()
 
-        # Call the during_trajectory hook for user actions while moving
-        if self._current_trajectory_index < len(self._trajectories):
-            trajectory_name, _ = self._trajectories[self._current_trajectory_index]
-            self.during_trajectory(self._current_trajectory_index, trajectory_name, elapsed_time, total_time)
+            case _Phase.START:
+                if self._current_trajectory is None:
+                    self._stop()
+                    self._phase = _Phase.DONE
+                    return
 
-        sample = self._current_trajectory.sample_at(elapsed_time, ChoreoAuto.is_red_alliance())
-        if sample is not None:
-            self.drivetrain.follow_trajectory(sample)
-        else:
-            self.drivetrain.stop()
+                self._timer.restart()
+                self._phase = _Phase.FOLLOW
 
-    @mb.state()
-    def run_action(self) -> None:
-        """Run the action for the current trajectory, then move to the next."""
-        self.drivetrain.stop()
-
-        # Run the action if one was defined
-        if self._current_trajectory_index < len(self._trajectories):
-            _, action = self._trajectories[self._current_trajectory_index]
-            if action is not None:
-                action()
-
-        # Move to the next trajectory
-        self._current_trajectory_index += 1
-        self._load_current_trajectory()
+            case _Phase.ACTION:
+                self._stop()
 
-        if self._current_trajectory is not None:
-            self.next_state("start_trajectory")
-        else:
-            self.next_state("all_complete")
+                # Run the action if one was defined
+                if self._current_action is not None:
+                    self._current_action()
 
-    @mb.state()
-    def all_complete(self) -> None:
-        """All trajectories complete, just stay stopped."""
-        self.drivetrain.stop()
+                # Move to the next trajectory
+                self._current_trajectory_index += 1
+                self._load_current_trajectory()
+
+                self._phase = _Phase.START if self._current_trajectory is not None else _Phase.DONE
+
+            case _Phase.DONE:
+                # All trajectories complete; the drivetrain idles on its own
+                pass
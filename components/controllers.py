@@ -1,10 +1,22 @@
 """Controllers for both the driver and operator."""
 
+from dataclasses import dataclass
+
 import wpilib
 from wpilib import RobotBase
 from wpilib.simulation import PS4ControllerSim
 
 
+@dataclass(slots=True)
+class _Snap:
+    """Per-tick snapshot of the driver inputs, written in place by poll()."""
+
+    lx: float = 0.0
+    ly: float = 0.0
+    rx: float = 0.0
+    brake: bool = False
+
+
 class OurController(wpilib.XboxController):
     """A wrapper around wpilib.PS4Controller to provide easier access to common controls."""
 
@@ -34,8 +46,33 @@ class DriverController(OurController):
     Default keyboard mappings in sim GUI:
     - WASD: Left stick (strafe/forward-back)
     - Arrow keys or IJKL: Right stick (rotation)
+
+    Call poll() once at the top of each control loop; the accessors below
+    read from that per-tick snapshot instead of hitting the HID again.
     """
 
+    def __init__(self, port: int) -> None:
+        """Create the controller with an empty (centered) input snapshot."""
+        super().__init__(port)
+        self._snap = _Snap()
+
+    def poll(self) -> None:
+        """Sample all driver inputs once for this control loop tick."""
+        s = self._snap
+        s.lx = self.getLeftX()
+        s.ly = self.getLeftY()
+        s.rx = super().getRightX()
+        s.brake = self.getXButton()
+
+    def getLeftStick(self) -> tuple[float, float]:
+        """Get the left stick position from the latest poll() snapshot."""
+        s = self._snap
+        return (s.lx, s.ly)
+
+    def getRightX(self) -> float:
+        """Get the right stick X position from the latest poll() snapshot."""
+        return self._snap.rx
+
     def should_brake(self) -> bool:
-        """Determine if the brake button is actively being pressed."""
-        return self.getXButton()
+        """Determine if the brake button was pressed at the latest poll()."""
+        return self._snap.brake
@@ -10,6 +10,10 @@ class Shooter:
     Pew! Pew!
     """
 
+    # Slot the attributes touched every control loop; __dict__ stays available
+    # for anything MagicBot injects (logger, tunables bookkeeping, ...)
+    __slots__ = ("enabled", "shooter_motor", "_last_cmd", "__dict__", "__weakref__")
+
     shooter_motor: wpilib.Talon
 
     # Shooter motor speed is tunable via NetworkTables
@@ -18,6 +22,7 @@ class Shooter:
     def __init__(self):
         """Code to run when initially creating the shooter."""
         self.enabled = False
+        self._last_cmd: float | None = None
 
     def enable(self):
         """Causes the shooter motor to spin."""
@@ -31,9 +36,12 @@ class Shooter:
 
     def execute(self):
         """This gets called at the end of the control loop."""
-        if self.enabled:
-            self.shooter_motor.set(self.shoot_speed)
-        else:
-            self.shooter_motor.set(0)
+        cmd = self.shoot_speed if self.enabled else 0.0
+
+        # Skip the HAL write when the command hasn't changed; the PWM output
+        # latches the last value, so most ticks become a single float compare.
+        if cmd != self._last_cmd:
+            self.shooter_motor.set(cmd)
+            self._last_cmd = cmd
 
         self.enabled = False
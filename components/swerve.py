@@ -68,6 +68,10 @@ class Drivetrain:
         # Pending request to apply in execute()
         self._pending_request: Optional[SwerveRequest] = None
 
+        # Last velocities written into the field-centric request, used to skip
+        # reconfiguring it when the command hasn't changed since last tick
+        self._last_field_centric_cmd: Optional[tuple[float, float, float]] = None
+
         # Field widget for simulation/dashboard
         self._field = Field2d()
         SmartDashboard.putData("Field", self._field)
@@ -98,11 +102,19 @@ class Drivetrain:
             velocity_y: Left velocity in m/s (positive = left on field).
             rotation_rate: Counter-clockwise rotation rate in rad/s.
         """
-        self._pending_request = (
-            self._field_centric_request.with_velocity_x(velocity_x)
-            .with_velocity_y(velocity_y)
-            .with_rotational_rate(rotation_rate)
-        )
+        # Only reconfigure the request when the command changed; steady-state
+        # driving (held or released sticks) then skips three FFI setter calls.
+        # The request itself is still re-applied every loop by execute().
+        cmd = (velocity_x, velocity_y, rotation_rate)
+        if cmd != self._last_field_centric_cmd:
+            self._field_centric_request = (
+                self._field_centric_request.with_velocity_x(velocity_x)
+                .with_velocity_y(velocity_y)
+                .with_rotational_rate(rotation_rate)
+            )
+            self._last_field_centric_cmd = cmd
+
+        self._pending_request = self._field_centric_request
 
     def drive(
         self,
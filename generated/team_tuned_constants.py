@@ -7,12 +7,15 @@ Modify these values based on real-world testing, then import this class
 instead of TunerConstants to use your tuned values.
 """
 
-import math
+import functools
+from typing import Final
 
 from phoenix6 import configs, signals, swerve, units
 
 from generated.tuner_constants import TunerConstants
 
+__all__ = ["TunedConstants"]
+
 
 class TunedConstants(TunerConstants):
     """Tuned constants that override the Tuner X generated values.
@@ -56,10 +59,9 @@ class TunedConstants(TunerConstants):
     # SPEED AT 12 VOLTS
     # Derived from motor free speed, gear ratio, and wheel size
     # ==========================================================================
-    # Derived: (motor RPS) * (2 * pi * wheel_radius) / gear_ratio
-    speed_at_12_volts: units.meters_per_second = (
-        _motor_free_speed_rps * (2 * math.pi * _wheel_radius) / _drive_gear_ratio
-    )
+    # Precomputed: (motor RPS) * (2 * pi * wheel_radius) / gear_ratio
+    #            = 100.0 * (2 * pi * 0.0508) / 6.75
+    speed_at_12_volts: Final[units.meters_per_second] = 4.72867872006997
 
     # ==========================================================================
     # DERIVED FEEDFORWARD VALUES (FOR FOC MODE)
@@ -68,14 +70,14 @@ class TunedConstants(TunerConstants):
     # This gives the motor's torque constant in Amps/RPS, then scaled by gear ratio
     # ==========================================================================
     # Motor kV (Amps per RPS at motor shaft)
-    _motor_kv = _motor_stall_current / _motor_free_speed_rps  # ~3.66 for Kraken X60
+    _motor_kv: Final[float] = 3.66  # = 366.0 / 100.0 for Kraken X60
 
     # Drive kV: Motor kV * gear ratio (Amps per RPS at wheel)
     # Higher gear ratio = more torque needed = higher kV
-    _drive_kv = _motor_kv * _drive_gear_ratio  # ~24.7 for Kraken with 6.75:1
+    _drive_kv: Final[float] = 24.705  # = 3.66 * 6.75 for Kraken with 6.75:1
 
     # Steer kV: Motor kV * gear ratio (Amps per RPS at azimuth)
-    _steer_kv = _motor_kv * _steer_gear_ratio  # ~78.4 for Kraken with 21.43:1
+    _steer_kv: Final[float] = 78.42857142857143  # = 3.66 * 150 / 7 for Kraken with 21.43:1
 
     # ==========================================================================
     # STEER MOTOR GAINS (FOC MODE - ALL VALUES IN AMPS)
@@ -86,7 +88,7 @@ class TunedConstants(TunerConstants):
     #   To use Tuner X Control Tab without interference, the robot code must NOT
     #   be commanding the motors.
     #
-    #   Deploy an empty project (or comment out `self.manuallyDrive()` in robot.py).
+    #   Deploy an empty project (or comment out the drive code in `teleopPeriodic()` in robot.py).
     # PHOENIX TUNER X INSTRUCTIONS:
     # 1. Open Phoenix Tuner X and connect to the robot.
     # 2. Put the robot on the ground (carpet is best).
@@ -130,16 +132,20 @@ class TunedConstants(TunerConstants):
     # kA (Acceleration Feedforward) - Amps per RPS² - usually leave at 0
     #   - Only tune if you need very aggressive acceleration profiles
     # ==========================================================================
-    _steer_gains = (
-        configs.Slot0Configs()
-        .with_k_p(0)  # Start: 0 | Tune up in Tuner X | Amps per rotation of error
-        .with_k_i(0)  # Start: 0 | Avoid unless steady-state error persists
-        .with_k_d(0)  # Start: 0 | Tune up in Tuner X | Dampens oscillation
-        .with_k_s(0)  # Start: 0 | Tune up in Tuner X | Amps to overcome friction
-        .with_k_v(_steer_kv)  # DERIVED ~78.4 | Adjust ±10% if needed | Amps per RPS
-        .with_k_a(0)  # Usually leave at 0 unless tuning acceleration
-        .with_static_feedforward_sign(signals.StaticFeedforwardSignValue.USE_CLOSED_LOOP_SIGN)
-    )
+    @classmethod
+    @functools.cache
+    def steer_gains(cls) -> configs.Slot0Configs:
+        """Build the steer Slot0 gains on first use (cached thereafter)."""
+        return (
+            configs.Slot0Configs()
+            .with_k_p(0)  # Start: 0 | Tune up in Tuner X | Amps per rotation of error
+            .with_k_i(0)  # Start: 0 | Avoid unless steady-state error persists
+            .with_k_d(0)  # Start: 0 | Tune up in Tuner X | Dampens oscillation
+            .with_k_s(0)  # Start: 0 | Tune up in Tuner X | Amps to overcome friction
+            .with_k_v(cls._steer_kv)  # DERIVED ~78.4 | Adjust ±10% if needed | Amps per RPS
+            .with_k_a(0)  # Usually leave at 0 unless tuning acceleration
+            .with_static_feedforward_sign(signals.StaticFeedforwardSignValue.USE_CLOSED_LOOP_SIGN)
+        )
 
     # ==========================================================================
     # DRIVE MOTOR GAINS (FOC MODE - ALL VALUES IN AMPS)
@@ -194,14 +200,18 @@ class TunedConstants(TunerConstants):
     #   - Can cause integral windup during acceleration. Not recommended.
     #   - Start: 0 | Keep at 0
     # ==========================================================================
-    _drive_gains = (
-        configs.Slot0Configs()
-        .with_k_p(0)  # Start: 0 | Tune up in Tuner X | Amps per RPS of error
-        .with_k_i(0)  # Keep at 0 - can cause windup issues
-        .with_k_d(0)  # Usually not needed for drive motors
-        .with_k_s(0)  # Start: 0 | Tune up in Tuner X | Amps to overcome friction
-        .with_k_v(_drive_kv)  # DERIVED ~24.7 | Adjust ±10% if needed | Amps per RPS
-    )
+    @classmethod
+    @functools.cache
+    def drive_gains(cls) -> configs.Slot0Configs:
+        """Build the drive Slot0 gains on first use (cached thereafter)."""
+        return (
+            configs.Slot0Configs()
+            .with_k_p(0)  # Start: 0 | Tune up in Tuner X | Amps per RPS of error
+            .with_k_i(0)  # Keep at 0 - can cause windup issues
+            .with_k_d(0)  # Usually not needed for drive motors
+            .with_k_s(0)  # Start: 0 | Tune up in Tuner X | Amps to overcome friction
+            .with_k_v(cls._drive_kv)  # DERIVED ~24.7 | Adjust ±10% if needed | Amps per RPS
+        )
 
     # ==========================================================================
     # SLIP CURRENT
@@ -237,6 +247,10 @@ class TunedConstants(TunerConstants):
     #     ~7V, reduce current limits.
     #   - Start: 60A steer, 80A drive | Adjust based on brownout behavior
     # ==========================================================================
-    _steer_initial_configs = configs.TalonFXConfiguration().with_current_limits(
-        configs.CurrentLimitsConfigs().with_stator_current_limit(60.0).with_stator_current_limit_enable(True)
-    )
+    @classmethod
+    @functools.cache
+    def steer_initial_configs(cls) -> configs.TalonFXConfiguration:
+        """Build the steer motor initial configs on first use (cached thereafter)."""
+        return configs.TalonFXConfiguration().with_current_limits(
+            configs.CurrentLimitsConfigs().with_stator_current_limit(60.0).with_stator_current_limit_enable(True)
+        )
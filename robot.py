@@ -1,19 +1,57 @@
 """Starting point for Robot code."""
 
-import math
+import importlib
+import pkgutil
 
 import magicbot
+import ntcore
 import wpilib
+from wpilib import DriverStation, Timer
 from wpimath.geometry import Pose2d, Rotation2d
-from magicbot import feedback
 
 import components
 import constants as const
 from generated.tuner_constants import TunerConstants
 
-# Maximum rotation speed in rad/s
-MAX_ROTATION_SPEED = math.pi
-    
+# Maximum rotation speed in rad/s (pi, inlined so math isn't imported just for it)
+MAX_ROTATION_SPEED = 3.141592653589793
+
+# Joystick axes with magnitude below this are treated as centered
+DEADBAND = 0.02
+
+# Game-specific message values that carry the auto winner
+_VALID_CODES = frozenset(("B", "R"))
+
+# Frequently-called DriverStation/Timer statics, bound once at import so the
+# periodic paths do one global load instead of chained attribute lookups
+_get_alliance = DriverStation.getAlliance
+_get_gsm = DriverStation.getGameSpecificMessage
+_match_time = Timer.getMatchTime
+_fpga_time = Timer.getFPGATimestamp
+_ALLIANCE_BLUE = DriverStation.Alliance.kBlue
+
+
+class _TS:
+    """Integer states for test mode's ping-pong drive, used as dispatch indices."""
+
+    FORWARD, WAIT_FORWARD, BACKWARD, WAIT_BACKWARD = range(4)
+
+
+def _can_score(second: int, won_auto: bool) -> bool:
+    """Pure scoring-window predicate for hubIsActive.
+
+    Args:
+        second: Whole seconds of match time remaining.
+        won_auto: Whether we won the auto period.
+    """
+    if second < 30 or second >= 130:
+        return True
+
+    # Checks what block we are in and if we can score
+    block = (130 - second) // 25
+    return ((block & 1) == 0) != won_auto
+
+
 class Scurvy(magicbot.MagicRobot):
     """The main class for the robot."""
 
@@ -22,6 +60,21 @@ class Scurvy(magicbot.MagicRobot):
     pewpew: components.Shooter
     driver_controller: components.DriverController
 
+    # Speed of the test-mode ping-pong drive, in m/s
+    TEST_SPEED = 2.0
+
+    # Match-context and test-mode state, predeclared with class-level defaults
+    # so every read is defined from the first robotPeriodic onward and first
+    # writes don't grow the instance dict mid-loop. Left unannotated so
+    # MagicBot doesn't mistake them for injectable components.
+    won_auto = False
+    test_state = _TS.FORWARD
+    _wait_start = 0.0
+    _alliance = None
+    _won_auto_known = False
+    _hub_cache = None
+    _hub_last = None
+
     # ------------------------------------------------------------------------------------------------------------------
     # MagicBot methods called at the right time; implement these as desired.
     # ------------------------------------------------------------------------------------------------------------------
@@ -31,25 +84,65 @@ class Scurvy(magicbot.MagicRobot):
         self.createMotors()
         self.createControllers()
         self.createLights()
+        self.preloadTrajectories()
+
+        # Teleop drive scaling, cached once as plain floats. The joystick-to-
+        # robot sign inversion is folded in: joystick down/right is positive,
+        # robot forward/left/CCW is positive.
+        self._speed_scale = -float(TunerConstants.speed_at_12_volts)
+        self._rot_scale = -MAX_ROTATION_SPEED
+
+        self._hub_entry = ntcore.NetworkTableInstance.getDefault().getTable("scurvy").getEntry("hubIsActive")
 
     def autonomousInit(self) -> None:
         """Called when auto starts (regardless of which one is selected), after every components' on_enable()."""
-        pass
+        self._refreshMatchContext()
 
     def teleopInit(self) -> None:
         """Called when teleop starts, after all components' on_enable()."""
-        pass
+        self._refreshMatchContext()
+        # Bind the drive method once; the drivetrain isn't injected yet when
+        # createObjects caches the scaling constants
+        self._drive = self.drivetrain.drive
 
     def teleopPeriodic(self) -> None:
         """Called periodically during teleop (and autonomous, if `self.use_teleop_in_autonomous==True`).
 
         Called before all components' execute().
         """
-        self.manuallyDrive()  # Assumes we always want to drive manually in teleop
-        
-        self.hubIsActive()
+        # Manual driving, inlined here (we always drive manually in teleop):
+        # one HID sample at the top is shared by every read below
+        dc = self.driver_controller
+        dc.poll()
 
-        # self.driveForward()
+        # Joystick values are positive to the right and down
+        strafe_right_percent, reverse_percent = dc.getLeftStick()
+        rotate_right_percent = dc.getRightX()
+
+        # Check if brake button is pressed
+        if dc.should_brake():
+            self.drivetrain.brake()
+            return
+
+        # With all sticks centered, hold a zero command; the drivetrain's
+        # change detector reduces the repeat ticks to a single tuple compare
+        if (
+            abs(strafe_right_percent) < DEADBAND
+            and abs(reverse_percent) < DEADBAND
+            and abs(rotate_right_percent) < DEADBAND
+        ):
+            self._drive(0.0, 0.0, 0.0)
+            return
+
+        # The negated scales cached in createObjects convert joystick values
+        # (down=positive, right=positive) to robot motion
+        # (forward=positive, left=positive, CCW=positive)
+        speed_scale = self._speed_scale
+        self._drive(
+            reverse_percent * speed_scale,
+            strafe_right_percent * speed_scale,
+            rotate_right_percent * self._rot_scale,
+        )
 
     def disabledInit(self) -> None:
         """Called afer the on_disable() of all components."""
@@ -64,50 +157,35 @@ class Scurvy(magicbot.MagicRobot):
         # Reset pose to (0,0,0) so our distance check works
         self.drivetrain.reset_pose(Pose2d(0, 0, Rotation2d(0)))
 
-        self.test_timer = wpilib.Timer()
-        self.test_timer.restart()
-        self.test_state = "forward"
-        print("Test Mode Started: Driving Forward 1m")
+        self._drive = self.drivetrain.drive
+        self._get_pose = self.drivetrain.get_pose
+        self._wait_start = _fpga_time()
+        self.test_state = _TS.FORWARD
+        self._test_handlers = (
+            self._testForward,
+            self._testWaitForward,
+            self._testBackward,
+            self._testWaitBackward,
+        )
+        wpilib.SmartDashboard.putString("test/state", "Driving Forward 1m")
 
     def testPeriodic(self) -> None:
-        """Called periodically while in test mode."""
-        # Simple ping-pong for tuning drive velocity
-        # Drive forward for 1 meter (approx 3ft), then backward
-
-        pose = self.drivetrain.get_pose()
-        test_speed = 2.0  # m/s
-
-        if self.test_state == "forward":
-            if pose.X() < 1.0:
-                self.drivetrain.drive(forward_speed=test_speed, left_speed=0, ccw_speed=0)
-            else:
-                self.test_state = "wait_forward"
-                self.test_timer.restart()
-                print("Reached 1m, Waiting...")
-
-        elif self.test_state == "wait_forward":
-            self.drivetrain.drive(0, 0, 0)
-            if self.test_timer.hasElapsed(1.0):
-                self.test_state = "backward"
-                print("Driving Backward")
-
-        elif self.test_state == "backward":
-            if pose.X() > 0.0:
-                self.drivetrain.drive(forward_speed=-test_speed, left_speed=0, ccw_speed=0)
-            else:
-                self.test_state = "wait_backward"
-                self.test_timer.restart()
-                print("Reached 0m, Waiting...")
-
-        elif self.test_state == "wait_backward":
-            self.drivetrain.drive(0, 0, 0)
-            if self.test_timer.hasElapsed(1.0):
-                self.test_state = "forward"
-                print("Driving Forward")
+        """Called periodically while in test mode.
+
+        Simple ping-pong for tuning drive velocity: drive forward for 1 meter
+        (approx 3ft), wait, then drive backward. The current state indexes
+        straight into the handler table.
+        """
+        self._test_handlers[self.test_state]()
 
     def robotPeriodic(self) -> None:
         """Called periodically regardless of mode, after the mode-specific xxxPeriodic() is called."""
-        pass
+        # Publish the hub state ourselves (change-gated) rather than through
+        # @feedback, which would re-publish at the full loop rate
+        active = self.hubIsActive()
+        if active is not self._hub_last:
+            self._hub_entry.setBoolean(active)
+            self._hub_last = active
 
     # ------------------------------------------------------------------------------------------------------------------
     # Helper methods
@@ -129,46 +207,94 @@ class Scurvy(magicbot.MagicRobot):
         """Set up CAN objects for lights."""
         pass
 
-    def manuallyDrive(self) -> None:
-        """Drive the robot based on controller input."""
-        # Joystick values are positive to the right and down
-        strafe_right_percent, reverse_percent = self.driver_controller.getLeftStick()
-        rotate_right_percent = self.driver_controller.getRightX()
+    def preloadTrajectories(self) -> None:
+        """Parse every Choreo trajectory used by an auto mode during robot startup.
 
-        # Check if brake button is pressed
-        if self.driver_controller.should_brake():
-            self.drivetrain.brake()
+        Loading a trajectory means parsing JSON from flash (tens of ms), and the
+        lazy cache in ChoreoAuto would otherwise pay for that inside on_enable()
+        while the 15-second auto clock is already running.
+        """
+        import autonomous
+        from autonomous.choreo_auto import ChoreoAuto, ChoreoMultiTrajectoryAuto
+
+        # MagicBot imports the autonomous package later in robotInit, so make
+        # sure all the auto mode subclasses exist before we look for them.
+        for module in pkgutil.iter_modules(autonomous.__path__):
+            importlib.import_module(f"autonomous.{module.name}")
+
+        names: set[str] = set()
+        for sub in ChoreoAuto.__subclasses__():
+            if sub.TRAJECTORY_NAME:
+                names.add(sub.TRAJECTORY_NAME)
+        for sub in ChoreoMultiTrajectoryAuto.__subclasses__():
+            try:
+                names.update(name for name, _ in sub().setup_trajectories())
+            except Exception:
+                # The mode will report its own error if it is ever selected
+                pass
+
+        ChoreoAuto.preload(names)
+
+    def _testForward(self) -> None:
+        """Drive forward until 1m from the start, then wait."""
+        if self._get_pose().X() < 1.0:
+            self._drive(self.TEST_SPEED, 0, 0)
         else:
-            # We invert joystick values to get the desired robot motion
-            # Joystick: down=positive, right=positive
-            # Robot: forward=positive, left=positive, CCW=positive
-            max_speed = TunerConstants.speed_at_12_volts
-            self.drivetrain.drive(
-                forward_speed=-reverse_percent * max_speed,
-                left_speed=-strafe_right_percent * max_speed,
-                ccw_speed=-rotate_right_percent * MAX_ROTATION_SPEED,
-            )
-
-    @feedback
-    def hubIsActive(self) -> bool:
-        alliance =  wpilib.DriverStation.getAlliance()
-        data = wpilib.DriverStation.getGameSpecificMessage()
-        if data in ("B", "R"):  # Checks if we won auto
-            self.won_auto = (data == "B") == (alliance == wpilib.DriverStation.Alliance.kBlue)
+            self.test_state = _TS.WAIT_FORWARD
+            self._wait_start = _fpga_time()
+            wpilib.SmartDashboard.putString("test/state", "Reached 1m, Waiting...")
+
+    def _testWaitForward(self) -> None:
+        """Hold still for a second before driving backward."""
+        self._drive(0, 0, 0)
+        if _fpga_time() - self._wait_start >= 1.0:
+            self.test_state = _TS.BACKWARD
+            wpilib.SmartDashboard.putString("test/state", "Driving Backward")
+
+    def _testBackward(self) -> None:
+        """Drive backward until back at the start, then wait."""
+        if self._get_pose().X() > 0.0:
+            self._drive(-self.TEST_SPEED, 0, 0)
         else:
-            return False
-
-        time_remaining = wpilib.Timer.getMatchTime()
-        can_score = True
+            self.test_state = _TS.WAIT_BACKWARD
+            self._wait_start = _fpga_time()
+            wpilib.SmartDashboard.putString("test/state", "Reached 0m, Waiting...")
+
+    def _testWaitBackward(self) -> None:
+        """Hold still for a second before driving forward again."""
+        self._drive(0, 0, 0)
+        if _fpga_time() - self._wait_start >= 1.0:
+            self.test_state = _TS.FORWARD
+            wpilib.SmartDashboard.putString("test/state", "Driving Forward")
+
+    def _refreshMatchContext(self) -> None:
+        """Re-cache DriverStation values that are fixed once a match period starts."""
+        self._alliance = _get_alliance()
+        self._won_auto_known = False
+        self._hub_cache = None
 
-        if time_remaining < 30:
-            can_score = True
-
-        elif time_remaining < 130:  # Checks what block we are and if we can score
-            block = int((130 - time_remaining) // 25)
-            can_score = (block % 2 == 0) != self.won_auto
-
-        else:
-            can_score = True
-        
+    def hubIsActive(self) -> bool:
+        """Report whether the hub is currently accepting scoring."""
+        # The game-specific message never changes once sent, so only query the
+        # DriverStation until a valid code arrives, then latch the result
+        if not self._won_auto_known:
+            data = _get_gsm()
+            if data not in _VALID_CODES:
+                return False
+            # Checks if we won auto
+            self.won_auto = (data == "B") == (self._alliance == _ALLIANCE_BLUE)
+            self._won_auto_known = True
+
+        # The answer only changes on whole-second boundaries (the blocks are
+        # 25 s long), so memoize on the current match-time second. None means
+        # no entry yet; a sentinel second would collide with the -1 that
+        # getMatchTime() reports when no match clock is running.
+        time_remaining = _match_time()
+        second = int(time_remaining)
+        cached = self._hub_cache
+        if cached is not None and second == cached[0]:
+            return cached[1]
+
+        can_score = _can_score(second, self.won_auto)
+        self._hub_cache = (second, can_score)
         return can_score
\ No newline at end of file